@@ -4,22 +4,50 @@ Chatterbox TTS Server
 A FastAPI server that provides text-to-speech synthesis using Chatterbox TTS.
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 import torchaudio as ta
 from chatterbox import ChatterboxTTS
 import torch
-import base64
-from io import BytesIO
-import io
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
+# orjson serialization when available; endpoints send the bytes in a plain
+# Response, since FastAPI deprecates ORJSONResponse
+try:
+    import orjson
+    json_dumps = orjson.dumps
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# SIMD-accelerated base64 when available; same API as the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 import uvicorn
 import logging
-from typing import Optional
+from typing import List, Optional
 
 def get_optimal_device():
     """Get the best available device for the current hardware"""
@@ -30,50 +58,191 @@ def get_optimal_device():
     else:
         return "cpu"
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Device probed once at import; only /health re-probes it
+DEVICE = get_optimal_device()
+
+# Supported model precisions, selectable via TTS_PRECISION
+PRECISION_DTYPES = {
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+    "fp32": torch.float32,
+}
+
+def autocast_supported(device, dtype):
+    """
+    Whether this torch build can autocast to dtype on device.
+    
+    Older releases reject MPS autocast outright, or warn and silently disable
+    it for dtypes they do not support; either way the reduced-precision
+    weights would then meet fp32 inputs.
+    """
+    is_available = getattr(torch.amp, "is_autocast_available", None)
+    if is_available is not None and not is_available(device):
+        return False
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            torch.autocast(device_type=device, dtype=dtype)
+    except (RuntimeError, UserWarning):
+        return False
+    return True
+
+def get_inference_dtype(device):
+    """Resolve the model dtype from TTS_PRECISION, or pick a default for the device"""
+    precision = os.getenv("TTS_PRECISION")
+    if precision is None:
+        precision = {"cuda": "fp16", "mps": "bf16"}.get(device, "fp32")
+    if precision not in PRECISION_DTYPES:
+        raise ValueError(
+            f"Unsupported TTS_PRECISION '{precision}' (expected one of: {', '.join(PRECISION_DTYPES)})"
+        )
+    dtype = PRECISION_DTYPES[precision]
+    if dtype != torch.float32 and not autocast_supported(device, dtype):
+        logger.warning(
+            "This torch build cannot autocast to %s on %s; falling back to fp32", precision, device
+        )
+        return torch.float32
+    return dtype
+
+# Submodules left unquantized: s3gen turns speech tokens into the waveform
+# and is the most sensitive to quantization error
+QUANT_EXCLUDE_NAMES = ("s3gen",)
+
+def quantize_model_int8(tts_model):
+    """Apply INT8 dynamic-activation / INT8-weight quantization to the Linear layers"""
+    try:
+        from torchao.quantization import quantize_, Int8DynamicActivationInt8WeightConfig
+    except ImportError:
+        logger.warning("TTS_QUANT=int8 requested but torchao is not installed; skipping quantization")
+        return
+    
+    for name, sub in vars(tts_model).items():
+        if isinstance(sub, torch.nn.Module) and name not in QUANT_EXCLUDE_NAMES:
+            quantize_(sub, Int8DynamicActivationInt8WeightConfig())
+            logger.info("Quantized %s to INT8", name)
+
+# Submodules wrapped by torch.compile when TTS_COMPILE=1
+COMPILE_SUBMODULES = ("t3", "s3gen", "ve")
+
+def compile_model(tts_model, device):
+    """Wrap the model's submodules with torch.compile for kernel fusion"""
+    if device == "mps":
+        logger.warning("torch.compile has no effect on MPS; skipping compilation")
+        return
+    
+    for name in COMPILE_SUBMODULES:
+        sub = getattr(tts_model, name, None)
+        if isinstance(sub, torch.nn.Module):
+            # dynamic=True avoids recompiling for every text/token length
+            setattr(tts_model, name, torch.compile(sub, mode="reduce-overhead", dynamic=True))
+            logger.info("Compiled %s with torch.compile", name)
+
+# Configure logging; messages use %-style arguments so filtered records are never formatted
+logging.basicConfig(level=os.getenv("TTS_LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Chatterbox TTS Server", version="1.0.0")
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load and warm up the model before the server accepts any traffic.
+    
+    Uvicorn only starts serving once this has yielded, so the first request
+    never pays the cold-load or first-forward cost.
+    """
+    await startup_event()
+    try:
+        yield
+    finally:
+        await shutdown_event()
+
+app = FastAPI(
+    title="Chatterbox TTS Server",
+    version="1.0.0",
+    lifespan=lifespan
+)
 
 # Global model instance
 model = None
+model_device = "cpu"
+model_dtype = torch.float32
+model_precision = "float32"  # str(model_dtype) without the "torch." prefix, for responses
+
+# CUDA stream for device-to-host waveform copies (CUDA only)
+download_stream = None
 
-# Voice presets for different characteristics
-VOICE_PRESETS = {
-    "default": {
+# Dynamic batching configuration
+MAX_BATCH_SIZE = int(os.getenv("TTS_MAX_BATCH_SIZE", "8"))
+MAX_BATCH_WAIT_MS = float(os.getenv("TTS_MAX_BATCH_WAIT_MS", "20"))
+# Longest/shortest text ratio allowed within one forward pass (0 disables)
+BATCH_LENGTH_RATIO = float(os.getenv("TTS_BATCH_LENGTH_RATIO", "2"))
+
+# Single thread that owns the model; every inference call runs here so
+# requests serialize on the device instead of contending for the GIL.
+# Created per lifespan, since a shut-down executor cannot be restarted
+model_executor: Optional[ThreadPoolExecutor] = None
+
+# Pending synthesis requests: (text, params_key, params_infer_code, params_refine_text, future)
+synthesis_queue: Optional[asyncio.Queue] = None
+batch_worker_task: Optional[asyncio.Task] = None
+
+# Voice presets for different characteristics; never modified at runtime, so
+# exposed read-only
+VOICE_PRESETS = MappingProxyType({
+    "default": MappingProxyType({
         "temperature": 0.3,
         "top_p": 0.7,
         "top_k": 20,
         "prompt": "[oral_2][laugh_0][break_6]"
-    },
-    "masculine": {
+    }),
+    "masculine": MappingProxyType({
         "temperature": 0.2,  # Lower for deeper, more stable voice
         "top_p": 0.6,        # More focused sampling
         "top_k": 15,         # More conservative choices
         "prompt": "[oral_1][laugh_0][break_4]"  # Less oral, more controlled
-    },
-    "deep_male": {
+    }),
+    "deep_male": MappingProxyType({
         "temperature": 0.1,  # Very stable
         "top_p": 0.5,        # Conservative
         "top_k": 10,         # Very focused
         "prompt": "[oral_0][laugh_0][break_8]"  # Minimal orality, longer pauses
-    },
-    "professional": {
+    }),
+    "professional": MappingProxyType({
         "temperature": 0.25,
         "top_p": 0.65,
         "top_k": 18,
         "prompt": "[oral_1][laugh_0][break_5]"
-    },
-    "feminine": {
+    }),
+    "feminine": MappingProxyType({
         "temperature": 0.4,  # More variation
         "top_p": 0.8,        # More diverse sampling
         "top_k": 25,         # More choices
         "prompt": "[oral_3][laugh_1][break_4]"  # More expressive
+    })
+})
+
+def build_generation_params(temperature, top_p, top_k, prompt, spk_emb=None):
+    """Build the (params_infer_code, params_refine_text) pair passed to model.infer"""
+    params_infer_code = {
+        'spk_emb': spk_emb,
+        'temperature': temperature,
+        'top_P': top_p,
+        'top_K': top_k,
     }
+    params_refine_text = {
+        'prompt': prompt
+    }
+    return params_infer_code, params_refine_text
+
+# Generation parameters for each preset, built once at import.
+# Shared across requests - never mutate these dicts.
+PRESET_GENERATION_PARAMS = {
+    name: build_generation_params(p["temperature"], p["top_p"], p["top_k"], p["prompt"])
+    for name, p in VOICE_PRESETS.items()
 }
 
 class TTSRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     text: str
     audio_prompt_path: Optional[str] = None
     exaggeration: float = 0.3  # Lower default for more masculine sound
@@ -83,15 +252,41 @@ class TTSRequest(BaseModel):
     top_p: Optional[float] = None        # Override preset top_p
     top_k: Optional[int] = None          # Override preset top_k
 
-@app.on_event("startup")
+# Built once; validating the raw body with it skips FastAPI's per-request
+# json.loads + field-by-field body resolution
+TTS_REQUEST_ADAPTER = TypeAdapter(TTSRequest)
+
+# Keeps the TTSRequest schema in the OpenAPI docs for routes that read the raw body
+TTS_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": TTSRequest.model_json_schema()}}
+    }
+}
+
+async def parse_tts_request(http_request: Request) -> TTSRequest:
+    """Validate the raw JSON body straight into a TTSRequest"""
+    body = await http_request.body()
+    try:
+        return TTS_REQUEST_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        # Same error shape as FastAPI's own body validation: locations are
+        # prefixed with "body" and the docs URL is left out
+        errors = [
+            {**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body)
+
 async def startup_event():
     """Initialize the Chatterbox model on server startup."""
-    global model
+    global model, model_device, model_dtype, model_precision, download_stream, synthesis_queue, batch_worker_task
+    global model_executor
+    model_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-model")
     try:
         logger.info("Loading Chatterbox TTS model...")
         
         # Get the optimal device for this hardware
-        device = get_optimal_device()
+        device = DEVICE
         
         if device == "mps":
             logger.info("🚀 Using Metal Performance Shaders (MPS) for acceleration")
@@ -100,145 +295,892 @@ async def startup_event():
         else:
             logger.info("⚠️  Using CPU (consider Metal/CUDA for better performance)")
         
-        logger.info(f"Device: {device}")
+        logger.info("Device: %s", device)
         logger.info("Note: First run will download model files (~2GB). This may take several minutes...")
         
-        model = ChatterboxTTS.from_pretrained(device=device)
-        logger.info(f"✅ Chatterbox TTS model loaded successfully on {device}!")
+        # A local checkpoint directory skips the Hugging Face Hub resolution
+        # round-trips; the weights are safetensors, so they are mmap-loaded
+        model_dir = os.getenv("TTS_MODEL_DIR")
+        if model_dir:
+            logger.info("Loading safetensors weights from %s (mmap)", model_dir)
+            model = ChatterboxTTS.from_local(model_dir, device)
+        else:
+            model = ChatterboxTTS.from_pretrained(device=device)
+        model_device = device
+        load_prompt_embedding.cache_clear()
+        if device == "cuda":
+            download_stream = torch.cuda.Stream()
+        logger.info("✅ Chatterbox TTS model loaded successfully on %s!", device)
         
-        # Clear any cached memory
-        if device == "mps":
-            torch.mps.empty_cache()
-        elif device == "cuda":
-            torch.cuda.empty_cache()
+        # Cast weights to reduced precision to halve memory traffic per token
+        model_dtype = get_inference_dtype(device)
+        if model_dtype != torch.float32:
+            for sub in vars(model).values():
+                if isinstance(sub, torch.nn.Module):
+                    sub.to(dtype=model_dtype)
+        model_precision = str(model_dtype).replace("torch.", "")
+        logger.info("Precision: %s", model_precision)
+        
+        # Optional INT8 quantization, mainly useful on CPU
+        quant = os.getenv("TTS_QUANT", "none")
+        if quant == "int8":
+            if device == "mps":
+                logger.warning("INT8 kernels are slow on MPS; consider TTS_QUANT=none")
+            quantize_model_int8(model)
+        elif quant != "none":
+            raise ValueError(f"Unsupported TTS_QUANT '{quant}' (expected 'int8' or 'none')")
+        
+        # Optional torch.compile; must run before warmup so it triggers compilation
+        if os.getenv("TTS_COMPILE") == "1":
+            compile_model(model, device)
+        
+        # Warmup also sizes the caching allocator's pool to the working set;
+        # it is deliberately not emptied afterwards, so real requests reuse
+        # those blocks instead of allocating from the driver again. It runs on
+        # the model thread because compiled CUDA graphs are recorded per thread
+        await asyncio.get_running_loop().run_in_executor(model_executor, warmup_model)
             
     except Exception as e:
-        logger.error(f"Failed to load Chatterbox model: {e}")
+        logger.error("Failed to load Chatterbox model: %s", e)
         raise e
 
-@app.get("/")
-def read_root():
-    """Health check endpoint."""
-    return {
+    synthesis_queue = asyncio.Queue()
+    batch_worker_task = asyncio.create_task(batch_worker())
+    logger.info(
+        "Batch worker started (max_batch_size=%d, max_wait_ms=%g)", MAX_BATCH_SIZE, MAX_BATCH_WAIT_MS
+    )
+
+async def shutdown_event():
+    """Stop the batch worker and fail any requests still waiting on it."""
+    if batch_worker_task is not None:
+        batch_worker_task.cancel()
+        try:
+            await batch_worker_task
+        except asyncio.CancelledError:
+            pass
+    if synthesis_queue is not None:
+        while not synthesis_queue.empty():
+            *_, future = synthesis_queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Server shutting down"))
+    if model_executor is not None:
+        model_executor.shutdown(wait=False)
+
+@contextlib.contextmanager
+def inference_context():
+    """
+    Inference mode plus autocast to the model's reduced precision, if any.
+    
+    Every call into the model goes through this, since its submodules are cast
+    to model_dtype and fp32 inputs would otherwise hit dtype mismatches.
+    """
+    if model_dtype != torch.float32:
+        autocast = torch.autocast(device_type=model_device, dtype=model_dtype)
+    else:
+        autocast = contextlib.nullcontext()
+    with torch.inference_mode(), autocast:
+        yield
+
+def infer_batch(texts: List[str], params_infer_code: dict, params_refine_text: dict) -> list:
+    """Run one batched forward pass. Blocking; call from an executor thread."""
+    with inference_context():
+        wavs = model.infer(
+            texts,
+            params_refine_text=params_refine_text,
+            params_infer_code=params_infer_code,
+            use_decoder=True
+        )
+        if wavs and download_stream is not None:
+            wavs = download_to_host(wavs)
+    return wavs
+
+def download_to_host(wavs):
+    """
+    Copy CUDA waveforms into pinned host memory on the download stream.
+    
+    All copies in the batch are issued asynchronously and synchronized once,
+    instead of blocking on a separate cudaMemcpy per waveform.
+    """
+    download_stream.wait_stream(torch.cuda.current_stream())
+    host_wavs = []
+    with torch.cuda.stream(download_stream):
+        for wav in wavs:
+            if torch.is_tensor(wav) and wav.is_cuda:
+                host = torch.empty(wav.shape, dtype=wav.dtype, pin_memory=True)
+                host.copy_(wav, non_blocking=True)
+                host_wavs.append(host)
+            else:
+                host_wavs.append(wav)
+    download_stream.synchronize()
+    return host_wavs
+
+# Directory that reference audio for audio_prompt_path must live in. The path
+# comes from network clients, so voice prompts are rejected when this is unset
+PROMPT_DIR = os.getenv("TTS_PROMPT_DIR")
+if PROMPT_DIR:
+    PROMPT_DIR = os.path.realpath(PROMPT_DIR)
+
+# Deliberately generic: echoing the path, OS error or decoder error would let
+# clients probe the server's filesystem
+INVALID_PROMPT_DETAIL = "Invalid audio_prompt_path"
+
+def stat_prompt_file(path):
+    """
+    Resolve a client-supplied reference audio path inside PROMPT_DIR and stat it.
+    
+    Relative paths are taken relative to PROMPT_DIR; symlinks are resolved
+    before the containment check, so they cannot point outside it.
+    
+    Returns:
+        Tuple of the resolved path and its mtime_ns, used to invalidate caches
+        when the file is replaced
+        
+    Raises:
+        ValueError: if the path resolves outside PROMPT_DIR
+        OSError: if the file cannot be read
+    """
+    resolved = os.path.realpath(os.path.join(PROMPT_DIR, path))
+    if os.path.commonpath((resolved, PROMPT_DIR)) != PROMPT_DIR:
+        raise ValueError("audio_prompt_path is outside TTS_PROMPT_DIR")
+    return resolved, os.stat(resolved).st_mtime_ns
+
+async def resolve_prompt(request: TTSRequest):
+    """
+    Resolve and stat the request's reference audio once, off the event loop.
+    
+    Returns:
+        The (path, mtime_ns) pair from stat_prompt_file, or None when no audio
+        prompt was given
+        
+    Raises:
+        HTTPException: 400 if prompts are disabled, or the file is outside
+            PROMPT_DIR or cannot be read
+    """
+    if not request.audio_prompt_path:
+        return None
+    if not PROMPT_DIR:
+        raise HTTPException(status_code=400, detail=INVALID_PROMPT_DETAIL)
+    try:
+        return await asyncio.to_thread(stat_prompt_file, request.audio_prompt_path)
+    except (ValueError, OSError) as e:
+        logger.warning("Rejected audio_prompt_path %r: %s", request.audio_prompt_path, e)
+        raise HTTPException(status_code=400, detail=INVALID_PROMPT_DETAIL)
+
+@lru_cache(maxsize=64)
+def load_prompt_embedding(path, mtime_ns):
+    """
+    Load a reference audio file and compute its speaker embedding on the model device.
+    
+    Cached per (path, mtime_ns) so a reference voice is only decoded and
+    embedded once, and re-embedded if the file is replaced; cleared whenever
+    the model is (re)loaded.
+    """
+    wav, sr = ta.load(path)
+    with inference_context():
+        return model.get_speaker_embedding(wav, sr).to(model_device)
+
+def warmup_model(runs=2):
+    """
+    Run throwaway forward passes so the first real request does not pay for
+    kernel selection, graph compilation and allocator warm-up. The first run
+    triggers algorithm search; the second runs on the selected kernels.
+    """
+    params_infer_code, params_refine_text = PRESET_GENERATION_PARAMS["masculine"]
+    
+    logger.info("Warming up model...")
+    start = time.perf_counter()
+    for _ in range(runs):
+        infer_batch(["Warmup."], params_infer_code, params_refine_text)
+    logger.info("Warmup complete in %.1fs", time.perf_counter() - start)
+
+def bucket_by_length(items, ratio=BATCH_LENGTH_RATIO):
+    """
+    Split queued items into runs of similar text length.
+    
+    Every text in a batched forward pass runs for as many steps as the
+    longest one, so a short text batched with a long one wastes most of its
+    decode steps. Items are sorted by length and a new bucket starts once a
+    text is more than `ratio` times longer than the bucket's shortest.
+    """
+    if ratio <= 0 or len(items) < 2:
+        return [items]
+    
+    buckets = []
+    bucket_start = 0
+    for item in sorted(items, key=lambda item: len(item[0])):
+        length = len(item[0])
+        if buckets and length <= ratio * bucket_start:
+            buckets[-1].append(item)
+        else:
+            buckets.append([item])
+            bucket_start = max(length, 1)
+    return buckets
+
+async def batch_worker():
+    """
+    Coalesce queued synthesis requests into batched model calls.
+    
+    A batch is flushed once it holds MAX_BATCH_SIZE items or MAX_BATCH_WAIT_MS
+    has passed since its first item arrived. Items whose generation parameters
+    differ are split into separate micro-batches, since one model.infer call
+    takes a single parameter set for all of its texts. Each of those is then
+    bucketed by text length (see bucket_by_length).
+    """
+    loop = asyncio.get_running_loop()
+    max_wait = MAX_BATCH_WAIT_MS / 1000
+    
+    while True:
+        batch = [await synthesis_queue.get()]
+        deadline = loop.time() + max_wait
+        
+        while len(batch) < MAX_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(synthesis_queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        # Group by identical generation parameters, then by similar length
+        groups = {}
+        for item in batch:
+            groups.setdefault(item[1], []).append(item)
+        micro_batches = [
+            bucket for items in groups.values() for bucket in bucket_by_length(items)
+        ]
+        
+        for items in micro_batches:
+            texts = [item[0] for item in items]
+            _, _, params_infer_code, params_refine_text, _ = items[0]
+            try:
+                wavs = await loop.run_in_executor(
+                    model_executor, infer_batch, texts, params_infer_code, params_refine_text
+                )
+                if wavs is None or len(wavs) != len(items):
+                    raise RuntimeError("No audio generated")
+            except Exception as e:
+                for *_, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            if len(items) > 1:
+                logger.info("Batched %d requests into one forward pass", len(items))
+            for (*_, future), wav in zip(items, wavs):
+                if not future.done():
+                    future.set_result(wav)
+
+# The root payload only depends on whether the model is loaded, so both
+# variants are serialized once at import
+ROOT_RESPONSE_BODIES = {
+    loaded: json_dumps({
         "status": "Chatterbox TTS Server is running", 
-        "model_loaded": model is not None,
+        "model_loaded": loaded,
         "available_presets": list(VOICE_PRESETS.keys())
-    }
+    })
+    for loaded in (False, True)
+}
+
+ROOT_RESPONSE_ETAGS = {
+    loaded: f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    for loaded, body in ROOT_RESPONSE_BODIES.items()
+}
+
+@app.get("/")
+def read_root(request: Request):
+    """Health check endpoint."""
+    loaded = model is not None
+    etag = ROOT_RESPONSE_ETAGS[loaded]
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=ROOT_RESPONSE_BODIES[loaded],
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
+
+# Hardware probes reported by /health are re-sampled at most this often (seconds)
+HARDWARE_STATUS_TTL = 0.5
+
+hardware_status_cache = {"ts": float("-inf"), "value": None}
+hardware_status_lock = threading.Lock()
+
+def get_hardware_status():
+    """
+    Probe device availability, sharing one result between calls within
+    HARDWARE_STATUS_TTL. The lock is held during the probe so concurrent
+    health checks wait for it instead of all probing at once.
+    """
+    with hardware_status_lock:
+        now = time.monotonic()
+        if now - hardware_status_cache["ts"] > HARDWARE_STATUS_TTL:
+            # Each backend is probed once; the device is derived from the
+            # results with get_optimal_device's precedence
+            mps_available = hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
+            cuda_available = torch.cuda.is_available()
+            hardware_status_cache["value"] = {
+                "device": "mps" if mps_available else "cuda" if cuda_available else "cpu",
+                "mps_available": mps_available,
+                "cuda_available": cuda_available
+            }
+            hardware_status_cache["ts"] = now
+        return hardware_status_cache["value"]
 
 @app.get("/health")
 def health_check():
     """Detailed health check."""
-    current_device = get_optimal_device()
-    return {
-        "status": "healthy" if model is not None else "unhealthy",
-        "model_loaded": model is not None,
-        "device": current_device,
-        "mps_available": hasattr(torch.backends, 'mps') and torch.backends.mps.is_available(),
-        "cuda_available": torch.cuda.is_available(),
-        "pytorch_version": torch.__version__
-    }
+    hardware = get_hardware_status()
+    return Response(
+        content=json_dumps({
+            "status": "healthy" if model is not None else "unhealthy",
+            "model_loaded": model is not None,
+            "device": hardware["device"],
+            "precision": model_precision,
+            "mps_available": hardware["mps_available"],
+            "cuda_available": hardware["cuda_available"],
+            "pytorch_version": torch.__version__
+        }),
+        media_type="application/json"
+    )
+
+# Chatterbox typically uses 24kHz sample rate
+SAMPLE_RATE = 24000
 
-@app.post("/synthesize")
-def synthesize_speech(request: TTSRequest):
+# Slice size used when streaming PCM to the client
+STREAM_CHUNK_BYTES = 64 * 1024
+
+def write_wav_header(nsamples, sample_rate, channels=1):
+    """Build the 44-byte RIFF/WAVE header for 16-bit PCM audio"""
+    block_align = channels * 2
+    data_size = nsamples * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b"data", data_size
+    )
+
+# Header for the common mono 24kHz case, serialized once; only the two size
+# fields change between requests
+WAV_HEADER_MONO = write_wav_header(0, SAMPLE_RATE, 1)
+
+def encode_wav(wav):
     """
-    Synthesize speech from text using Chatterbox TTS.
+    Encode a (channels, samples) float waveform as 16-bit PCM WAV.
+    
+    The output is one uninitialized allocation that the header and PCM are
+    written into directly, avoiding both a zero-fill and a header+data
+    concatenation. Like wav_to_pcm16, the waveform is consumed.
     
-    Args:
-        request: TTSRequest containing text and optional parameters
-        
     Returns:
-        JSON response with base64-encoded audio data
+        A byte memoryview over the encoded WAV file
     """
-    if model is None:
-        raise HTTPException(status_code=503, detail="Model not loaded")
+    channels, nsamples = wav.shape
+    data_size = nsamples * channels * 2
     
-    try:
-        logger.info(f"🎙️  Synthesizing: '{request.text[:50]}{'...' if len(request.text) > 50 else ''}'")
-        
-        current_device = get_optimal_device()
-        
-        # Get voice preset configuration
-        preset = VOICE_PRESETS.get(request.voice_preset, VOICE_PRESETS["masculine"])
-        
-        # Use request overrides if provided, otherwise use preset values
-        temperature = request.temperature if request.temperature is not None else preset["temperature"]
-        top_p = request.top_p if request.top_p is not None else preset["top_p"]
-        top_k = request.top_k if request.top_k is not None else preset["top_k"]
-        
-        logger.info(f"Voice: {request.voice_preset}, Device: {current_device}")
-        logger.info(f"Params: temp={temperature:.2f}, top_p={top_p:.2f}, top_k={top_k}")
-        
-        # Configure generation parameters for voice characteristics
-        params_infer_code = {
-            'spk_emb': None,
-            'temperature': temperature,
-            'top_P': top_p,
-            'top_K': top_k,
-        }
-        
-        params_refine_text = {
-            'prompt': preset["prompt"]
-        }
+    if channels == 1:
+        header = bytearray(WAV_HEADER_MONO)
+        struct.pack_into("<I", header, 4, 36 + data_size)
+        struct.pack_into("<I", header, 40, data_size)
+    else:
+        header = write_wav_header(nsamples, SAMPLE_RATE, channels)
+    
+    out = torch.empty(44 + data_size, dtype=torch.uint8)
+    out_view = memoryview(out.numpy())
+    out_view[:44] = header
+    with torch.inference_mode():
+        pcm = out[44:].view(torch.int16).view(nsamples, channels)
+        pcm.copy_(wav.contiguous().clamp_(-1.0, 1.0).mul_(32767.0).t())
+    return out_view
+
+def wav_to_pcm16(wav):
+    """
+    Convert a (channels, samples) float waveform to interleaved 16-bit PCM.
+    
+    Clamps and scales in place to avoid materializing intermediate tensors, so
+    the waveform is consumed. Inference mode is required because tensors
+    produced by the model are inference tensors.
+    
+    Returns:
+        A byte memoryview over the int16 tensor's own storage (no tobytes copy)
+    """
+    with torch.inference_mode():
+        pcm = wav.contiguous().clamp_(-1.0, 1.0).mul_(32767.0).to(torch.int16)
+        return memoryview(pcm.t().contiguous().view(-1).numpy()).cast("B")
+
+def iter_wav_chunks(wav):
+    """
+    Yield a WAV header followed by PCM converted one STREAM_CHUNK_BYTES slice
+    at a time, so the full int16 buffer is never materialized.
+    """
+    channels, nsamples = wav.shape
+    yield write_wav_header(nsamples, SAMPLE_RATE, channels)
+    frames = max(1, STREAM_CHUNK_BYTES // (2 * channels))
+    for start in range(0, nsamples, frames):
+        yield wav_to_pcm16(wav[:, start:start + frames])
+
+def iter_chunks(data):
+    """Yield a byte string in STREAM_CHUNK_BYTES slices without copying it"""
+    view = memoryview(data)
+    for offset in range(0, len(view), STREAM_CHUNK_BYTES):
+        yield view[offset:offset + STREAM_CHUNK_BYTES]
+
+class SynthesisCache:
+    """
+    Thread-safe LRU cache of encoded WAV results keyed by a hash of the
+    synthesis inputs, with an optional on-disk tier that survives restarts.
+    
+    Both tiers are bounded by total bytes as well as the memory tier's entry
+    count, since a single long result is megabytes of PCM. Results larger
+    than a tier's whole budget are not stored in it.
+    """
+    
+    def __init__(self, maxsize, max_bytes, disk_dir=None, disk_max_bytes=0):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._disk_entries = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._load_disk_index()
+    
+    @property
+    def enabled(self):
+        return (self.maxsize > 0 and self.max_bytes > 0) or bool(self.disk_dir)
+    
+    @staticmethod
+    def make_key(text, preset_name, voice_params, audio_prompt_path):
+        raw = (
+            f"{text}|{preset_name}|{voice_params['temperature']}|{voice_params['top_p']}"
+            f"|{voice_params['top_k']}|{audio_prompt_path}"
+        )
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+    
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                return data
+            on_disk = key in self._disk_entries
+            if on_disk:
+                self._disk_entries.move_to_end(key)
         
-        # Use inference mode for better performance
-        with torch.inference_mode():
-            # Generate speech waveform using Chatterbox TTS with voice controls
-            wavs = model.infer(
-                [request.text], 
-                params_refine_text=params_refine_text,
-                params_infer_code=params_infer_code,
-                use_decoder=True
-            )
+        if on_disk:
+            try:
+                with open(self._disk_path(key), "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                logger.warning("Could not read cached result from %s: %s", self.disk_dir, e)
+                return None
+            self._store(key, data)
+            return data
+        return None
+    
+    def put(self, key, data):
+        self._store(key, data)
+        if self.disk_dir and len(data) <= self.disk_max_bytes:
+            # A failed disk write only loses the entry; it never fails the request
+            try:
+                self._write_disk(key, data)
+            except OSError as e:
+                logger.warning("Could not write cached result to %s: %s", self.disk_dir, e)
+                return
+            
+            with self._lock:
+                self._disk_bytes += len(data) - self._disk_entries.pop(key, 0)
+                self._disk_entries[key] = len(data)
+                evicted = []
+                while self._disk_bytes > self.disk_max_bytes:
+                    old_key, size = self._disk_entries.popitem(last=False)
+                    self._disk_bytes -= size
+                    evicted.append(old_key)
+            for old_key in evicted:
+                with contextlib.suppress(OSError):
+                    os.remove(self._disk_path(old_key))
+    
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key.hex()}.wav")
+    
+    def _write_disk(self, key, data):
+        """Write an entry atomically through a temp file unique to this writer"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._disk_path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+    
+    def _load_disk_index(self):
+        """Index results left by a previous run, oldest first, trimmed to the budget"""
+        found = []
+        with os.scandir(self.disk_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(".wav"):
+                    continue
+                try:
+                    key = bytes.fromhex(name[:-4])
+                    stat = entry.stat()
+                except (ValueError, OSError):
+                    continue
+                found.append((stat.st_mtime_ns, key, stat.st_size))
         
-        # Extract audio data
-        if wavs and len(wavs) > 0:
-            wav = wavs[0]
+        for _, key, size in sorted(found):
+            self._disk_entries[key] = size
+            self._disk_bytes += size
+        while self._disk_bytes > self.disk_max_bytes:
+            old_key, size = self._disk_entries.popitem(last=False)
+            self._disk_bytes -= size
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._disk_path(old_key))
+    
+    def _store(self, key, data):
+        if self.maxsize <= 0 or len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self._bytes += len(data) - len(self._entries.pop(key, b""))
+            self._entries[key] = data
+            while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self._bytes -= len(old)
+
+# Cache of finished synthesis results. TTS_CACHE_SIZE=0 disables the memory
+# tier; each tier is also capped in bytes (defaults: 256 MiB memory, 2 GiB disk)
+synthesis_cache = SynthesisCache(
+    maxsize=int(os.getenv("TTS_CACHE_SIZE", "512")),
+    max_bytes=int(os.getenv("TTS_CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+    disk_dir=os.getenv("TTS_CACHE_DIR"),
+    disk_max_bytes=int(os.getenv("TTS_CACHE_DIR_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
+)
+
+# Texts longer than this are split into sentences before synthesis
+SENTENCE_SPLIT_MIN_CHARS = 200
+
+# Silence inserted between sentence segments (200ms)
+SENTENCE_GAP_SAMPLES = SAMPLE_RATE // 5
+
+# Sentence boundary: terminal punctuation followed by whitespace, so decimals
+# like "3.14" and punctuation inside tokens do not split (same rule as
+# SENTENCE_BREAK in TTSService.ts)
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+# Words whose trailing period does not end a sentence ("Dr. Smith")
+ABBREVIATIONS = frozenset({"mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "jr.", "sr.", "vs.", "e.g.", "i.e."})
+
+def ends_with_abbreviation(sentence):
+    """Whether a split candidate ends in a title or an initial like "J." rather than a sentence"""
+    word = sentence.rsplit(None, 1)[-1].lower()
+    return word in ABBREVIATIONS or (len(word) == 2 and word[0].isalpha() and word[1] == ".")
+
+def split_sentences(text):
+    """Split text into sentences, keeping their terminal punctuation"""
+    text = text.strip()
+    if not text:
+        return []
+    
+    sentences = []
+    for piece in SENTENCE_BREAK.split(text):
+        if sentences and ends_with_abbreviation(sentences[-1]):
+            sentences[-1] = f"{sentences[-1]} {piece}"
         else:
-            raise HTTPException(status_code=500, detail="No audio generated")
+            sentences.append(piece)
+    return sentences
+
+def resolve_voice_params(request: TTSRequest):
+    """
+    Resolve the preset and effective sampling parameters for a request.
+    
+    Returns:
+        Tuple of the preset name and a dict of temperature/top_p/top_k, with
+        request overrides applied on top of the preset values
+    """
+    preset_name = request.voice_preset if request.voice_preset in VOICE_PRESETS else "masculine"
+    preset = VOICE_PRESETS[preset_name]
+    
+    # Use request overrides if provided, otherwise use preset values
+    voice_params = {
+        "temperature": request.temperature if request.temperature is not None else preset["temperature"],
+        "top_p": request.top_p if request.top_p is not None else preset["top_p"],
+        "top_k": request.top_k if request.top_k is not None else preset["top_k"]
+    }
+    return preset_name, voice_params
+
+async def generate_waveform(request: TTSRequest, preset_name, voice_params, prompt=None):
+    """
+    Run a synthesis request through the batch worker.
+    
+    Args:
+        request: TTSRequest containing text and optional parameters
+        preset_name: Resolved voice preset name
+        voice_params: Effective temperature/top_p/top_k for this request
+        prompt: Resolved (path, mtime_ns) of the reference audio, from resolve_prompt
         
-        # Move tensor to CPU for audio processing if it's on GPU
+    Returns:
+        The (channels, samples) fp32 CPU waveform
+    """
+    preset = VOICE_PRESETS[preset_name]
+    temperature = voice_params["temperature"]
+    top_p = voice_params["top_p"]
+    top_k = voice_params["top_k"]
+    
+    text = request.text
+    text_len = len(text)
+    
+    # One record per request rather than one per detail line; the guard
+    # skips building the text preview when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "🎙️  Synthesizing: '%s%s' (voice=%s, device=%s, temp=%.2f, top_p=%.2f, top_k=%s)",
+            text[:50], '...' if text_len > 50 else '',
+            request.voice_preset, DEVICE, temperature, top_p, top_k
+        )
+    
+    loop = asyncio.get_running_loop()
+    
+    # Speaker embedding from the reference audio, if one was given
+    spk_emb = None
+    if prompt is not None:
+        try:
+            spk_emb = await loop.run_in_executor(model_executor, load_prompt_embedding, *prompt)
+        except Exception as e:
+            logger.warning("Could not embed audio prompt %s: %s", prompt[0], e)
+            raise HTTPException(status_code=400, detail=INVALID_PROMPT_DETAIL)
+    
+    # Configure generation parameters for voice characteristics; only build
+    # new dicts when the request overrides the preset
+    if (request.temperature is None and request.top_p is None
+            and request.top_k is None and spk_emb is None):
+        params_infer_code, params_refine_text = PRESET_GENERATION_PARAMS[preset_name]
+    else:
+        params_infer_code, params_refine_text = build_generation_params(
+            temperature, top_p, top_k, preset["prompt"], spk_emb
+        )
+    
+    # Long text is split into sentences so the batch worker can decode them
+    # together as short sequences instead of one long autoregressive pass
+    if text_len > SENTENCE_SPLIT_MIN_CHARS:
+        texts = split_sentences(text) or [text]
+    else:
+        texts = [text]
+    
+    # Hand the texts to the batch worker and wait for their waveforms
+    # The prompt version is part of the key so requests made before and after
+    # the file was replaced never share one speaker embedding
+    params_key = (temperature, top_p, top_k, preset["prompt"], prompt)
+    futures = []
+    for segment in texts:
+        future = loop.create_future()
+        await synthesis_queue.put(
+            (segment, params_key, params_infer_code, params_refine_text, future)
+        )
+        futures.append(future)
+    wavs = await asyncio.gather(*futures)
+    
+    pieces = []
+    for wav in wavs:
+        # Move tensor to CPU for audio processing if it's on GPU, back in fp32 for encoding
         if hasattr(wav, 'cpu'):
-            wav = wav.cpu()
-        
-        # Chatterbox typically uses 24kHz sample rate
-        sample_rate = 24000
+            wav = wav.cpu().float()
         
-        # Ensure wav is properly shaped for torchaudio
+        # Ensure wav has a channel dimension
         if wav.dim() == 1:
-            wav = wav.unsqueeze(0)  # Add channel dimension
-        
-        # Save to a bytes buffer and encode for JSON response  
-        buffer = BytesIO()
-        ta.save(buffer, wav, sample_rate, format='wav')
-        buffer.seek(0)
-        audio_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        
-        logger.info(f"✅ Generated {len(audio_base64)} bytes of audio ({wav.shape})")
-        
-        return {
-            "audio": audio_base64,
-            "sample_rate": sample_rate,
-            "format": "wav", 
-            "success": True,
-            "device_used": current_device,
-            "voice_preset": request.voice_preset,
-            "voice_params": {
-                "temperature": temperature,
-                "top_p": top_p,
-                "top_k": top_k
-            }
-        }
+            wav = wav.unsqueeze(0)
         
+        if pieces:
+            pieces.append(torch.zeros(wav.shape[0], SENTENCE_GAP_SAMPLES))
+        pieces.append(wav)
+    
+    if len(pieces) > 1:
+        logger.info("Joined %d sentence segments", len(texts))
+        return torch.cat(pieces, dim=-1)
+    return pieces[0]
+
+async def synthesize_audio(request: TTSRequest):
+    """
+    Produce encoded WAV bytes for a request, serving repeats from the cache.
+    
+    Returns:
+        Tuple of the WAV bytes, the voice parameters used, and the cache
+        status ("HIT" or "MISS")
+    """
+    preset_name, voice_params = resolve_voice_params(request)
+    prompt = await resolve_prompt(request)
+    prompt_key = None
+    if prompt is not None:
+        prompt_key = f"{prompt[0]}@{prompt[1]}"
+    text = request.text
+    key = SynthesisCache.make_key(text, preset_name, voice_params, prompt_key)
+    
+    # The disk tier does blocking file I/O; keep it off the event loop
+    if synthesis_cache.disk_dir:
+        wav_bytes = await asyncio.to_thread(synthesis_cache.get, key)
+    else:
+        wav_bytes = synthesis_cache.get(key)
+    if wav_bytes is not None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "♻️  Cache hit: '%s%s'", text[:50], '...' if len(text) > 50 else ''
+            )
+        return wav_bytes, voice_params, "HIT"
+    
+    wav = await generate_waveform(request, preset_name, voice_params, prompt)
+    # PCM conversion is CPU-bound; keep it off the event loop
+    wav_bytes = await asyncio.to_thread(encode_wav, wav)
+    if synthesis_cache.disk_dir:
+        await asyncio.to_thread(synthesis_cache.put, key, wav_bytes)
+    else:
+        synthesis_cache.put(key, wav_bytes)
+    return wav_bytes, voice_params, "MISS"
+
+async def synthesize_waveform(request: TTSRequest):
+    """
+    Generate the raw waveform for a request, bypassing the result cache.
+    
+    Returns:
+        Tuple of the waveform tensor and the voice parameters used
+    """
+    preset_name, voice_params = resolve_voice_params(request)
+    prompt = await resolve_prompt(request)
+    wav = await generate_waveform(request, preset_name, voice_params, prompt)
+    return wav, voice_params
+
+async def run_synthesis(http_request: Request, synthesize):
+    """
+    Shared front half of the synthesis endpoints.
+    
+    Parses the body, rejects the request while the model is not loaded, and
+    runs synthesize(request), mapping any failure other than an
+    HTTPException raised for a bad request to a 500.
+    
+    Returns:
+        Tuple of the parsed TTSRequest and the result of synthesize
+    """
+    request = await parse_tts_request(http_request)
+    if model is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    
+    try:
+        return request, await synthesize(request)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error during speech synthesis: {e}")
+        logger.error("Error during speech synthesis: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/synthesize", openapi_extra=TTS_REQUEST_OPENAPI, deprecated=True)
+async def synthesize_speech(http_request: Request):
+    """
+    Synthesize speech from text using Chatterbox TTS.
+    
+    Deprecated: base64 inflates the audio by a third and costs an encode and
+    decode pass; use /synthesize.wav, which returns the WAV bytes directly.
+    
+    Args:
+        http_request: Request whose JSON body is a TTSRequest
+        
+    Returns:
+        JSON response with base64-encoded audio data
+    """
+    request, (wav_bytes, voice_params, cache_status) = await run_synthesis(
+        http_request, synthesize_audio
+    )
+    
+    # Encode as base64 for the JSON response; off the event loop since
+    # multi-MB payloads would otherwise stall every other request
+    audio_base64 = await asyncio.to_thread(base64.b64encode, memoryview(wav_bytes))
+    
+    logger.info("✅ Generated %d bytes of audio", len(audio_base64))
+    
+    # Serialize only the small metadata object and splice the base64 audio
+    # in as raw bytes; base64 is JSON-safe, so the multi-MB string never
+    # passes through a JSON encoder
+    metadata = json_dumps({
+        "sample_rate": SAMPLE_RATE,
+        "format": "wav", 
+        "success": True,
+        "device_used": DEVICE,
+        "voice_preset": request.voice_preset,
+        "voice_params": voice_params
+    })
+    body = b"".join((b'{"audio":"', audio_base64, b'",', metadata[1:]))
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": cache_status}
+    )
+
+def synthesis_info_header(request: TTSRequest, voice_params):
+    """
+    Metadata that /synthesize returns in its JSON body, as a header value.
+    
+    Serialized with the stdlib encoder's ASCII escaping rather than
+    json_dumps: orjson emits raw UTF-8, which a header cannot carry.
+    """
+    return json.dumps({
+        "sample_rate": SAMPLE_RATE,
+        "format": "wav",
+        "device_used": DEVICE,
+        "voice_preset": request.voice_preset,
+        "voice_params": voice_params
+    }, separators=(",", ":"))
+
+@app.post("/synthesize.wav", openapi_extra=TTS_REQUEST_OPENAPI)
+async def synthesize_speech_wav(http_request: Request):
+    """
+    Synthesize speech and stream it back as a raw WAV file.
+    
+    Skips the base64/JSON wrapping of /synthesize, so the client receives the
+    audio bytes directly and can start reading before the body is complete.
+    The metadata /synthesize puts in its body is sent in X-Synthesis-Info.
+    """
+    # Without a result cache there is no need for the full WAV bytes, so
+    # convert and stream the waveform chunk by chunk
+    if not synthesis_cache.enabled:
+        request, (wav, voice_params) = await run_synthesis(
+            http_request, synthesize_waveform
+        )
+        
+        logger.info("✅ Streaming %d samples of audio (%s)", wav.shape[-1], wav.shape)
+        return StreamingResponse(
+            iter_wav_chunks(wav),
+            media_type="audio/wav",
+            headers={"X-Synthesis-Info": synthesis_info_header(request, voice_params)}
+        )
+    
+    request, (wav_bytes, voice_params, cache_status) = await run_synthesis(
+        http_request, synthesize_audio
+    )
+    
+    logger.info("✅ Streaming %d bytes of audio", len(wav_bytes))
+    return StreamingResponse(
+        iter_chunks(wav_bytes),
+        media_type="audio/wav",
+        headers={
+            "X-Cache": cache_status,
+            "X-Synthesis-Info": synthesis_info_header(request, voice_params)
+        }
+    )
+
 if __name__ == "__main__":
-    # Run the server
+    # Run the server. Each worker process loads its own copy of the model,
+    # so only raise TTS_WORKERS when the device has memory for several.
     uvicorn.run(
         "chatterbox_server:app", 
         host="0.0.0.0", 
         port=8000, 
         reload=False,
-        log_level="info"
+        log_level="info",
+        workers=int(os.getenv("TTS_WORKERS", "1")),
+        timeout_keep_alive=30,
+        backlog=2048
     )
\ No newline at end of file
@@ -16,6 +16,15 @@ export interface TTSResponse {
   error?: string;
 }
 
+// Metadata sent by /synthesize.wav in the X-Synthesis-Info header
+export interface SynthesisInfo {
+  sample_rate: number;
+  format: string;
+  device_used?: string;
+  voice_preset?: string;
+  voice_params?: VoiceConfig;
+}
+
 export interface PodcastOptions {
   inputFile: string;
   outputFile: string;
@@ -9,6 +9,9 @@ import { FileUtils } from '../../utilities/fileUtils.js';
  * Follows SRP - handles only FFmpeg-specific audio processing
  */
 export class FFmpegConcatenator implements IAudioProcessor {
+  // The ffmpeg binary does not come or go while the process runs, so the
+  // `ffmpeg -version` probe is spawned at most once and shared
+  private static availability: Promise<boolean> | null = null;
   private logger: ILogger;
 
   constructor(logger: ILogger) {
@@ -27,18 +30,14 @@ export class FFmpegConcatenator implements IAudioProcessor {
         tempPaths.push(tempPath);
       }
 
-      // Create output path
-      const outputPath = FileUtils.getTempFilePath(`concatenated_${Date.now()}.mp3`, 'audio/output');
-      
-      // Concatenate using file paths
-      await this.concatenate(tempPaths, outputPath);
-      
-      // Read result back as buffer
-      const fs = await import('fs/promises');
-      const result = await fs.readFile(outputPath);
+      // Concatenate and read the MP3 straight from ffmpeg's stdout rather
+      // than writing it to a temp file and reading it back
+      this.logger.info(`Concatenating ${tempPaths.length} audio segments with ffmpeg`);
+      const result = await this.runConcat(tempPaths, ['-f', 'mp3', 'pipe:1']);
+      this.logger.info(`Successfully concatenated ${tempPaths.length} segments (${result.length} bytes)`);
       
       // Cleanup temp files
-      await this.cleanupTempFiles([...tempPaths, outputPath]);
+      await this.cleanupTempFiles(tempPaths);
       
       return result;
     } catch (error) {
@@ -50,7 +49,15 @@ export class FFmpegConcatenator implements IAudioProcessor {
 
   async concatenate(segmentPaths: string[], outputPath: string): Promise<void> {
     this.logger.info(`Concatenating ${segmentPaths.length} audio segments with ffmpeg`);
-    
+    await this.runConcat(segmentPaths, [outputPath]);
+    this.logger.info(`Successfully concatenated ${segmentPaths.length} segments into ${outputPath}`);
+  }
+
+  /**
+   * Run ffmpeg's concat filter over the given inputs. Resolves with whatever
+   * ffmpeg wrote to stdout, which is empty unless the output is a pipe.
+   */
+  private runConcat(segmentPaths: string[], outputArgs: string[]): Promise<Buffer> {
     return new Promise((resolve, reject) => {
       // Create ffmpeg command for concatenation
       const inputArgs: string[] = [];
@@ -68,23 +75,27 @@ export class FFmpegConcatenator implements IAudioProcessor {
         '-filter_complex', filterComplex,
         '-map', '[out]',
         '-y', // Overwrite output file
-        outputPath
+        ...outputArgs
       ];
       
       this.logger.debug('Running ffmpeg with args:', ffmpegArgs);
       
       const ffmpeg = spawn('ffmpeg', ffmpegArgs);
       
+      const output: Buffer[] = [];
       let stderr = '';
       
+      ffmpeg.stdout.on('data', (data: Buffer) => {
+        output.push(data);
+      });
+      
       ffmpeg.stderr.on('data', (data) => {
         stderr += data.toString();
       });
       
       ffmpeg.on('close', (code) => {
         if (code === 0) {
-          this.logger.info(`Successfully concatenated ${segmentPaths.length} segments into ${outputPath}`);
-          resolve();
+          resolve(Buffer.concat(output));
         } else {
           this.logger.error('FFmpeg concatenation failed', { code, stderr });
           reject(new AudioProcessingError(
@@ -110,17 +121,20 @@ export class FFmpegConcatenator implements IAudioProcessor {
   }
 
   async isAvailable(): Promise<boolean> {
-    return new Promise((resolve) => {
-      const ffmpeg = spawn('ffmpeg', ['-version']);
-      
-      ffmpeg.on('close', (code) => {
-        resolve(code === 0);
+    if (!FFmpegConcatenator.availability) {
+      FFmpegConcatenator.availability = new Promise((resolve) => {
+        const ffmpeg = spawn('ffmpeg', ['-version']);
+        
+        ffmpeg.on('close', (code) => {
+          resolve(code === 0);
+        });
+        
+        ffmpeg.on('error', () => {
+          resolve(false);
+        });
       });
-      
-      ffmpeg.on('error', () => {
-        resolve(false);
-      });
-    });
+    }
+    return FFmpegConcatenator.availability;
   }
 
   private async cleanupTempFiles(filePaths: string[]): Promise<void> {
@@ -1,5 +1,5 @@
 import { ITTSProvider } from '../../interfaces/ITTSProvider.js';
-import { VoiceConfig, TTSResponse, HealthStatus, TTSError } from '../../interfaces/types.js';
+import { VoiceConfig, SynthesisInfo, HealthStatus, TTSError } from '../../interfaces/types.js';
 import { ILogger } from '../../interfaces/ILogger.js';
 
 /**
@@ -51,7 +51,8 @@ export class ChatterboxProvider implements ITTSProvider {
         ...config
       };
 
-      const response = await fetch(`${this.serverURL}/synthesize`, {
+      // Raw WAV endpoint - avoids the base64/JSON round-trip of /synthesize
+      const response = await fetch(`${this.serverURL}/synthesize.wav`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -66,9 +67,9 @@ export class ChatterboxProvider implements ITTSProvider {
         );
       }
 
-      const result: TTSResponse = await response.json();
+      const audioBuffer = Buffer.from(await response.arrayBuffer());
       
-      if (!result.success || !result.audio) {
+      if (audioBuffer.length === 0) {
         throw new TTSError(
           'No audio data returned from TTS server',
           'NO_AUDIO_DATA'
@@ -76,14 +77,14 @@ export class ChatterboxProvider implements ITTSProvider {
       }
 
       // Log voice parameters used (helpful for debugging)
-      if (result.voice_params) {
+      const synthesisInfoHeader = response.headers.get('X-Synthesis-Info');
+      if (synthesisInfoHeader) {
+        const synthesisInfo: SynthesisInfo = JSON.parse(synthesisInfoHeader);
         this.logger.info(
-          `🎙️  Voice: ${result.voice_params.voice_preset || 'default'} (temp=${result.voice_params.temperature || 'auto'})`
+          `🎙️  Voice: ${synthesisInfo.voice_preset || 'default'} (temp=${synthesisInfo.voice_params?.temperature || 'auto'})`
         );
       }
 
-      // Decode the base64 audio data
-      const audioBuffer = Buffer.from(result.audio, 'base64');
       this.logger.debug('Speech synthesis completed', { audioSize: audioBuffer.length });
       
       return audioBuffer;
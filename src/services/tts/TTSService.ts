@@ -3,6 +3,10 @@ import { VoiceConfig, AudioSegment } from '../../interfaces/types.js';
 import { ILogger } from '../../interfaces/ILogger.js';
 import { ValidationUtils } from '../../utilities/validationUtils.js';
 
+// Segment boundaries, shared by every splitIntoSegments call
+const PARAGRAPH_BREAK = /\n\s*\n/;
+const SENTENCE_BREAK = /(?<=[.!?])\s+/;
+
 /**
  * TTS Service - Orchestrates text-to-speech operations
  * Follows SRP - handles TTS business logic and workflow
@@ -55,42 +59,61 @@ export class TTSService {
   splitIntoSegments(text: string, maxLength: number = 600): AudioSegment[] {
     this.logger.debug(`Splitting text into segments (max length: ${maxLength})`);
     
-    // First try splitting by double newlines (paragraphs)
-    let segments = text.split(/\n\s*\n/).filter(segment => segment.trim().length > 0);
+    // Short text without line breaks can hold neither a paragraph break nor
+    // an over-long paragraph, so it is a single segment as-is
+    if (text.length <= maxLength && !text.includes('\n')) {
+      const trimmed = text.trim();
+      const segments = trimmed ? [{ text: trimmed, index: 0 }] : [];
+      this.logger.info(`Text split into ${segments.length} segments`);
+      return segments;
+    }
     
-    // If segments are still too long, split them further
+    // Split by double newlines (paragraphs), trimming each once and skipping
+    // blank ones; paragraphs that are still too long are split further
     const finalSegments: AudioSegment[] = [];
     let segmentIndex = 0;
     
-    for (const segment of segments) {
-      if (segment.length <= maxLength) {
+    for (const segment of text.split(PARAGRAPH_BREAK)) {
+      const trimmed = segment.trim();
+      if (!trimmed) {
+        continue;
+      }
+      
+      if (trimmed.length <= maxLength) {
         finalSegments.push({
-          text: segment.trim(),
+          text: trimmed,
           index: segmentIndex++
         });
       } else {
-        // Split long segments at sentence boundaries
-        const sentences = segment.split(/(?<=[.!?])\s+/);
-        let currentSegment = '';
+        // Split long segments at sentence boundaries; splitting the trimmed
+        // paragraph yields non-empty sentences with no outer whitespace, so
+        // the joined segments need no further trimming
+        const sentences = trimmed.split(SENTENCE_BREAK);
+        // Collect the sentences of the segment being built and join them once
+        // it is full, tracking its joined length instead of re-concatenating
+        let currentSentences: string[] = [];
+        let currentLength = 0;
         
         for (const sentence of sentences) {
-          if (currentSegment.length + sentence.length + 1 <= maxLength) {
-            currentSegment += (currentSegment ? ' ' : '') + sentence;
+          if (currentLength + sentence.length + 1 <= maxLength) {
+            currentLength += (currentSentences.length ? 1 : 0) + sentence.length;
+            currentSentences.push(sentence);
           } else {
-            if (currentSegment) {
+            if (currentSentences.length) {
               finalSegments.push({
-                text: currentSegment.trim(),
+                text: currentSentences.join(' '),
                 index: segmentIndex++
               });
             }
-            currentSegment = sentence;
+            currentSentences = [sentence];
+            currentLength = sentence.length;
           }
         }
         
         // Add remaining content
-        if (currentSegment.trim()) {
+        if (currentSentences.length) {
           finalSegments.push({
-            text: currentSegment.trim(),
+            text: currentSentences.join(' '),
             index: segmentIndex++
           });
         }
@@ -1,3 +1,5 @@
+import { promises as fs } from 'fs';
+import * as path from 'path';
 import { ILogger } from '../interfaces/ILogger.js';
 
 /**
@@ -36,6 +38,7 @@ export class ConsoleLogger implements ILogger {
  */
 export class FileLogger extends ConsoleLogger {
   private logFilePath: string;
+  private logDirReady: Promise<unknown> | null = null;
 
   constructor(logFilePath: string = 'tmp/logs/app.log', enableDebug: boolean = false) {
     super(enableDebug);
@@ -44,19 +47,20 @@ export class FileLogger extends ConsoleLogger {
 
   private async writeToFile(level: string, message: string, ...args: any[]): Promise<void> {
     try {
-      const fs = await import('fs/promises');
-      const path = await import('path');
-      
       const timestamp = new Date().toISOString();
       const logLine = `[${timestamp}] ${level}: ${message} ${args.length ? JSON.stringify(args) : ''}\n`;
       
-      // Ensure log directory exists
-      const logDir = path.dirname(this.logFilePath);
-      await fs.mkdir(logDir, { recursive: true });
+      // Ensure log directory exists; created once and shared by every write
+      if (!this.logDirReady) {
+        this.logDirReady = fs.mkdir(path.dirname(this.logFilePath), { recursive: true });
+      }
+      await this.logDirReady;
       
       // Append to log file
       await fs.appendFile(this.logFilePath, logLine);
     } catch (error) {
+      // Retry the directory creation on the next write
+      this.logDirReady = null;
       // Don't throw - logging should not break the application
       console.error('Logging error:', error);
     }